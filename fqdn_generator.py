@@ -52,43 +52,101 @@ Same SWQL Query for test interface data:
 
 
 # Built-in modules
+import asyncio
 import ipaddress
+import itertools
 import socket
-import concurrent.futures
+import struct
 import logging
 import re
 
+# Third-party modules
+try:
+    import aiodns
+    import pycares
+except ImportError:
+    aiodns = None
+
 # Local Modules
 import tools
 import settings as s
 
 
+# Module-level logger; %-style arguments defer string formatting to the handler, so filtered
+# records (the common case at the default WARNING level) cost no string building at all.
+logger = logging.getLogger(__name__)
+
+
+
 
 
 
+# Separator characters are all normalized to dashes in one translate() pass, and any run of
+# dashes is collapsed with a single linear regex scan instead of repeated str.replace passes.
+_IFACE_TRANS = str.maketrans({'_': '-', '.': '-', ':': '-', '/': '-'})
+_DASH_RE = re.compile(r'-+')
+
+# Pre-compiled patterns for _clean_interface_hostname().  Compiling once at module scope keeps
+# pattern parsing (and re's internal cache lookups) out of the per-row hot loop.
+#  # match letters up to digit, OR leters to dash to more letters up to digit (this includes "port-channel")
+# Only used to extract a readable type name for the error message when an interface is unmapped.
+_IFACE_TYPE_RE = re.compile(r'^[a-z]+-[a-z]+|^[a-z]+')
+# All known interface types from INTERFACE_MAP compiled into one alternation (longest key first,
+# so "fortygigabitethernet" wins over "ethernet").  One match() both recognises the type and
+# captures the number tail, replacing two regex calls plus a dict membership test per row.
+# The lookahead stops a key from matching as a mere prefix of a longer, unmapped type
+# ("vlanif100", "tunnel-te1") — those must keep raising so the operator extends the map —
+# while still allowing number tails like "ge-0-0-0" or "port-channel10".
+_IFACE_ALT = re.compile('^(' + '|'.join(sorted(s.INTERFACE_MAP.keys(), key=len, reverse=True)) + ')(?!-?[a-z])(.*)$')
+
+
+def _fast_ipv4_parse(address_text: str):
+    """Parses a clean dotted-quad IPv4 string without the cost of ipaddress.IPv4Address.
+
+    Returns a (integer_form, dotted_quad) tuple.  Raises ValueError for anything that
+    isn't exactly four plain decimal octets; inet_aton alone would silently accept
+    shorthand like "10.1" and octal octets like "010", which the caller should instead
+    hand to the full parser.
+    """
+    octets = address_text.split(".")
+    if len(octets) != 4:
+        raise ValueError(f"Not a dotted quad:  {address_text}")
+    for octet in octets:
+        if not octet.isdigit() or (len(octet) > 1 and octet[0] == "0"):
+            raise ValueError(f"Not a plain decimal octet:  {octet}")
+    try:
+        packed = socket.inet_aton(address_text)
+    except OSError:
+        raise ValueError(f"Octet out of range:  {address_text}")
+    return struct.unpack("!I", packed)[0], address_text
+
 
 class Address_FQDN():
     """An object for tracking address-to-fqdn mappings.  Provides additional functionality like checking forward/reverse lookup existance in dns."""
 
     def __init__(self, ipv4_address, hostname: str, domain: str = s.DEFAULT_DOMAIN):
         # ipv4_address
-        if isinstance(ipv4_address, str):
+        if isinstance(ipv4_address, ipaddress.IPv4Address):
+            ipv4_address = str(ipv4_address)
+        elif not isinstance(ipv4_address, str):
+            logger.warning("%s - Please provide an IP Address as a str() or IPv4Address() object.", hostname)
+            raise Exception("Improper argument:  ipv4_address")
+        ipv4_address = ipv4_address.strip()
+        try:
+            self.ipv4_int, self.ip_address = _fast_ipv4_parse(ipv4_address)
+        except ValueError:
+            # Fall back to the full (much slower) parser for anything unusual
             try:
-                ipv4_address = ipaddress.IPv4Address(ipv4_address)
-            except:
-                logging.warning(f"{hostname} - Please provide a properly formatted IP Address.")
+                parsed = ipaddress.IPv4Address(ipv4_address)
+            except Exception:
+                logger.warning("%s - Please provide a properly formatted IP Address.", hostname)
                 raise Exception("Improper argument:  ipv4_address")
-        elif isinstance(ipv4_address, ipaddress.IPv4Address):
-            ipv4_address = ipv4_address
-        else:
-            logging.warning(f"{hostname} - Please provide an IP Address as a str() or IPv4Address() object.")
-            raise Exception("Improper argument:  ipv4_address")
-        self.ipv4_address = ipv4_address
-        self.ip_address = str(ipv4_address.compressed).strip()
+            self.ipv4_int = int(parsed)
+            self.ip_address = parsed.compressed
         
         # hostname
         if not isinstance(hostname, str) or len(hostname) == 0:
-            logging.warning(f"{hostname} - Please provide a properly formatted hostname.")
+            logger.warning("%s - Please provide a properly formatted hostname.", hostname)
             raise Exception("Improper argument:  hostname")
         self.hostname = hostname.strip().lower()
         
@@ -96,21 +154,35 @@ class Address_FQDN():
         if domain == None:
             domain = s.DEFAULT_DOMAIN
         elif not isinstance(domain, str):
-            logging.warning(f"{hostname} - If providing a domain, please properly format it.")
+            logger.warning("%s - If providing a domain, please properly format it.", hostname)
             raise Exception("Improper argument:  domain")
         elif len(domain) == 0:
-            logging.info(f"{hostname} - Zero-length domain name provided, setting it to the default: {s.DEFAULT_DOMAIN}.")
+            logger.info("%s - Zero-length domain name provided, setting it to the default: %s.", hostname, s.DEFAULT_DOMAIN)
             domain = s.DEFAULT_DOMAIN
         domain = domain.strip().lower()
         self.domain = domain
 
         self.full_name = self.hostname + "." + self.domain
 
-        # forward/reverse lookup data
+        # forward/reverse lookup data.  Populated by resolve(); None means "not checked yet".
+        self.forward_lookup_exists = None
+        self.forward_lookup_needs_update = None
         self.forward_lookup_existing_value = None
+        self.reverse_lookup_exists = None
+        self.reverse_lookup_needs_update = None
         self.reverse_lookup_existing_value = None
+
+        # ptr record
+        self.ptr_record = ".".join(self.ip_address.split(".")[::-1]) + ".in-addr.arpa"
+
+    async def resolve(self, resolver):
+        """Checks forward/reverse lookup existance in dns and records the results on the object.
+
+        Args:
+            resolver: an _AsyncResolver used to perform the lookups.
+        """
         try:
-            address_info = socket.gethostbyname(self.full_name)
+            address_info = await resolver.forward(self.full_name)
             if address_info == self.ip_address:
                 self.forward_lookup_exists = True
                 self.forward_lookup_needs_update = False
@@ -120,12 +192,14 @@ class Address_FQDN():
                 self.forward_lookup_needs_update = True
                 self.forward_lookup_existing_value = address_info
         except Exception as error:
-            logging.info(f"{self.full_name} : {error}")
+            # %-style args are only formatted if INFO survives filtering; the lookup-failed
+            # path is the common case during bulk runs.
+            logger.info("%s : %s", self.full_name, error)
             self.forward_lookup_exists = False
             self.forward_lookup_needs_update = True
             self.forward_lookup_existing_value = None
         try:
-            hostname_info = socket.gethostbyaddr(self.ip_address)[0]
+            hostname_info = await resolver.reverse(self.ip_address)
             if hostname_info == self.full_name:
                 self.reverse_lookup_exists = True
                 self.reverse_lookup_needs_update = False
@@ -139,19 +213,205 @@ class Address_FQDN():
                 self.reverse_lookup_needs_update = True
                 self.reverse_lookup_existing_value = hostname_info
         except Exception as error:
-            logging.info(f"{self.full_name} : {error}")
+            logger.info("%s : %s", self.full_name, error)
             self.reverse_lookup_exists = False
             self.reverse_lookup_needs_update = True
             self.reverse_lookup_existing_value = None
 
-        
-        # ptr record
-        self.ptr_record = ipv4_address.reverse_pointer
-
     def __repr__(self):
         return self.full_name
 
 
+# One cache for the whole process, so duplicate IPs/domains across runs of main() don't
+# re-query.  With DNS_CACHE_PATH set, failures also survive process restarts.  Created on
+# first use, so importing this module doesn't touch the on-disk cache.
+_DNS_CACHE = None
+
+
+def _get_dns_cache():
+    global _DNS_CACHE
+    if _DNS_CACHE is None:
+        _DNS_CACHE = tools.DNSCache(failure_ttl=s.DNS_FAILURE_TTL, persist_path=s.DNS_CACHE_PATH)
+    return _DNS_CACHE
+
+
+class _AsyncResolver():
+    """A thin wrapper around aiodns (c-ares), falling back to the event loop's
+    getaddrinfo/getnameinfo when aiodns is not installed.  Either way, many
+    lookups can be multiplexed on a single thread.  Results (including failures)
+    are cached in the shared tools.DNSCache."""
+
+    def __init__(self, timeout: float = 1.0, cache: tools.DNSCache = None):
+        if aiodns is not None:
+            # rotate=True lets c-ares round-robin across the upstream nameservers
+            self._resolver = aiodns.DNSResolver(timeout=timeout, tries=2, rotate=True)
+            if s.NAMESERVERS:
+                self._resolver.nameservers = s.NAMESERVERS
+        else:
+            self._resolver = None
+        self._cache = cache if cache is not None else _get_dns_cache()
+
+    async def forward(self, full_name: str):
+        """Returns the IPv4 address (str) the name resolves to.  Raises on lookup failure."""
+        cached = self._cache.get('forward', full_name)
+        if cached is not tools.DNSCache.MISS:
+            return cached
+        try:
+            if self._resolver is not None:
+                # getaddrinfo rather than the deprecated gethostbyname; pycares hands the
+                # node address back as bytes
+                result = await self._resolver.getaddrinfo(full_name, family=socket.AF_INET)
+                address = result.nodes[0].addr[0]
+                if isinstance(address, bytes):
+                    address = address.decode()
+            else:
+                loop = asyncio.get_running_loop()
+                # AI_NUMERICSERV skips the service-name lookup glibc would otherwise attempt.
+                address_info = await loop.getaddrinfo(full_name, None, family=socket.AF_INET,
+                                                      type=socket.SOCK_STREAM, flags=socket.AI_NUMERICSERV)
+                address = address_info[0][4][0]
+        except Exception as error:
+            self._cache.store_failure('forward', full_name, error)
+            raise
+        self._cache.store('forward', full_name, address)
+        return address
+
+    async def reverse(self, ip_address: str):
+        """Returns the hostname (str) the address resolves to.  Raises on lookup failure."""
+        cached = self._cache.get('reverse', ip_address)
+        if cached is not tools.DNSCache.MISS:
+            return cached
+        try:
+            if self._resolver is not None:
+                # getnameinfo rather than the deprecated gethostbyaddr; NAMEREQD keeps the
+                # old contract of raising when no PTR exists instead of echoing the address
+                result = await self._resolver.getnameinfo((ip_address, 0), pycares.ARES_NI_NAMEREQD)
+                hostname = result.node
+                if isinstance(hostname, bytes):
+                    hostname = hostname.decode()
+            else:
+                loop = asyncio.get_running_loop()
+                hostname_info = await loop.getnameinfo((ip_address, 0), socket.NI_NAMEREQD)
+                hostname = hostname_info[0]
+        except Exception as error:
+            self._cache.store_failure('reverse', ip_address, error)
+            raise
+        self._cache.store('reverse', ip_address, hostname)
+        return hostname
+
+
+# A single warm resolver channel is kept for the whole process:  c-ares pipelines hundreds of
+# outstanding UDP queries on one socket, so re-creating resolver state per batch would throw
+# away the amortised connect/parse cost.
+_SHARED_RESOLVER = None
+_SHARED_RESOLVER_LOOP = None
+
+
+def _get_resolver():
+    """Returns the shared _AsyncResolver, creating it on first use.
+
+    An aiodns channel is bound to the event loop it was created under, so the channel is
+    rebuilt when called from a different loop (e.g. successive asyncio.run invocations)."""
+    global _SHARED_RESOLVER, _SHARED_RESOLVER_LOOP
+    loop = asyncio.get_running_loop()
+    if _SHARED_RESOLVER is None or _SHARED_RESOLVER_LOOP is not loop:
+        _SHARED_RESOLVER = _AsyncResolver()
+        _SHARED_RESOLVER_LOOP = loop
+    return _SHARED_RESOLVER
+
+
+async def _resolve_all(address_objects: list):
+    """Internally used coroutine, for batch-resolving the lookups of many Address_FQDN objects.
+
+    Async batching is needed due to long wait times on DNS lookups; a single thread can keep
+    hundreds of queries in flight.  Concurrency is bounded by a semaphore so we don't flood
+    the resolver, and tasks are consumed as they complete so each one's exception is caught
+    and logged instead of silently aborting the batch."""
+    if len(address_objects) == 0:
+        return
+    resolver = _get_resolver()
+    if s.MULTITHREAD:
+        concurrency = min(s.MAX_CONCURRENT_LOOKUPS, len(address_objects))
+    else:
+        concurrency = 1
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _resolve_one(address_object):
+        async with semaphore:
+            await address_object.resolve(resolver)
+            return address_object
+
+    for completed in asyncio.as_completed([_resolve_one(address_object) for address_object in address_objects]):
+        try:
+            address_object = await completed
+            logger.debug("Finished lookups for:  %s - %s", address_object.full_name, address_object.ip_address)
+        except Exception as error:
+            logger.warning("Lookup task failed:\n%s", error)
+
+    # Push any batched negative-cache rows to disk now that the batch is done
+    _get_dns_cache().flush()
+
+
+class FQDNTable():
+    """A column-oriented (structure-of-arrays) view of many Address_FQDN results.
+
+    Holds one flat list per output column instead of pointer-chasing nine attributes
+    per object, so bulk CSV emission becomes a straight traversal of parallel arrays."""
+
+    HEADER = (
+        "FQDN",
+        "PTR",
+        "IP Address",
+        "FLU Exists",
+        "FLU Existing Value",
+        "FLU Needs Update",
+        "RLU Exists",
+        "RLU Existing Value",
+        "RLU Needs Update")
+
+    def __init__(self):
+        self.full_name = []
+        self.ptr_record = []
+        self.ip_address = []
+        self.forward_lookup_exists = []
+        self.forward_lookup_existing_value = []
+        self.forward_lookup_needs_update = []
+        self.reverse_lookup_exists = []
+        self.reverse_lookup_existing_value = []
+        self.reverse_lookup_needs_update = []
+
+    def append(self, address_object: Address_FQDN):
+        self.full_name.append(address_object.full_name)
+        self.ptr_record.append(address_object.ptr_record)
+        self.ip_address.append(address_object.ip_address)
+        self.forward_lookup_exists.append(address_object.forward_lookup_exists)
+        self.forward_lookup_existing_value.append(address_object.forward_lookup_existing_value)
+        self.forward_lookup_needs_update.append(address_object.forward_lookup_needs_update)
+        self.reverse_lookup_exists.append(address_object.reverse_lookup_exists)
+        self.reverse_lookup_existing_value.append(address_object.reverse_lookup_existing_value)
+        self.reverse_lookup_needs_update.append(address_object.reverse_lookup_needs_update)
+
+    @classmethod
+    def from_objects(cls, address_objects: list):
+        table = cls()
+        for address_object in address_objects:
+            table.append(address_object)
+        return table
+
+    def rows(self):
+        """Returns an iterator of output rows, one tuple per record, in column order of HEADER."""
+        return zip(
+            self.full_name,
+            self.ptr_record,
+            self.ip_address,
+            self.forward_lookup_exists,
+            self.forward_lookup_existing_value,
+            self.forward_lookup_needs_update,
+            self.reverse_lookup_exists,
+            self.reverse_lookup_existing_value,
+            self.reverse_lookup_needs_update)
+
+
 def _clean_device_hostname(hostname: str):
     '''
     Removes the domain, underscores, and multiple instances of dashes.  Makes all characters lowercase.
@@ -165,35 +425,24 @@ def _clean_device_hostname(hostname: str):
     hostname = hostname.lower()
     if hostname.find(".") >= 0:
         hostname = hostname.split(".")[0]
-    hostname = hostname.replace("_","-") 
-    hostname = hostname.replace("--","-")
-    hostname = hostname.replace("--","-") # This second one catches odd-numbered dashed (3,5,7,etc...)
+    hostname = hostname.translate(_IFACE_TRANS)
+    hostname = _DASH_RE.sub("-", hostname)
     return hostname
 
 
 def _clean_interface_hostname(hostname: str, interface: str):
     interface = interface.lower()
-    interface = interface.replace("_","-")
-    interface = interface.replace(".","-")
-    interface = interface.replace(":","-")
-    interface = interface.replace("/","-")
-    interface = interface.replace("--","-")
-    interface = interface.replace("--","-") # This second one catches odd-numbered dashed (3,5,7,etc...)
-
-    # split the type and number data so we can easily manipulate the information
-    #  # match letters up to digit, OR leters to dash to more letters up to digit (this includes "port-channel")
-    interface_type = re.findall('^[a-z]+-[a-z]+|^[a-z]+', interface)[0]
-    #  # match everything after and including the first digit
-    try:
-        interface_number = re.findall('[0-9].*', interface)[0]
-    except IndexError:
-        interface_number = ""
-
-    # rename the "long name" to a "short name" as mapped in global settings INTERFACE_MAP
-    if interface_type in s.INTERFACE_MAP.keys():
-        interface_type = s.INTERFACE_MAP[interface_type]
-    else:
+    interface = interface.translate(_IFACE_TRANS)
+    interface = _DASH_RE.sub("-", interface)
+
+    # recognise the "long name" type and capture the number tail in a single pass
+    alt_match = _IFACE_ALT.match(interface)
+    if alt_match is None:
+        type_match = _IFACE_TYPE_RE.match(interface)
+        interface_type = type_match.group(0) if type_match else interface
         raise Exception(f"Interface type '{interface_type}' not found in 'INTERFACE_MAP' global settings.")
+    interface_type = s.INTERFACE_MAP[alt_match.group(1)]
+    interface_number = alt_match.group(2).lstrip("-")
 
     # build the new standardized and shortened interface name
     if len(interface_number) == 0:
@@ -207,16 +456,6 @@ def _check_if_interface(hostname: str, existing_hostname: str):
     pass
 
 
-def _build_address_fqdn_object(container: list, address_data: dict):
-    """Internally used function, for mutil-threading the building of FQDN object.
-    
-    Multi-threaded is needed due to long wait times on DNS lookups.  See docs for the ThreadPoolExecutor() method
-    in python's built-in module concurrent.futures."""
-    logging.debug(f"Starting to build object data for:  {address_data['hostname']} - {address_data['ipv4_address']}" )
-    container.append(Address_FQDN(**address_data))
-    logging.debug(f"Finished building object data for:  {address_data['hostname']} - {address_data['ipv4_address']}" )
-
-
 def main():
     # Collect the arguments, if any were provided.
     parser = tools.argument_parser()
@@ -225,78 +464,78 @@ def main():
     # Initiate logger settings
     tools.setup_logger(log_level=args.log_level, log_type=args.log_type)
 
-    # Get the input data and convert it to a odered-list of dictionaries
-    csv_file = tools.OpenFile.gui_ask_open_csv()
-    csv_file = tools.OpenFile.process_csv(csv_file)
-    address_table = tools.table_to_dictionary(csv_file)
-
-    if len(address_table) == 0:
-        logging.warning("No data was provided.")
+    # Get the input data as a header plus a stream of positional rows.  A path supplied on
+    # the command line skips the Tk dialog (and the tkinter import) entirely.
+    csv_path = args.input if args.input else tools.OpenFile.gui_ask_open_csv()
+    columns, csv_rows = tools.OpenFile.process_csv(csv_path)
+
+    # Resolve the column indices once, so the hot loop reads each row by position instead
+    # of paying a dict allocation plus a hash per field access.
+    host_i = columns.index('device_hostname') if 'device_hostname' in columns else -1
+    ip_i = columns.index('ip_address') if 'ip_address' in columns else -1
+    iface_i = columns.index('interface_name') if 'interface_name' in columns else -1
+    # 'domain_name' is the documented header; 'domain' is accepted for older sheets
+    domain_col = 'domain_name' if 'domain_name' in columns else 'domain'
+    domain_i = columns.index(domain_col) if domain_col in columns else -1
+    if host_i < 0 or ip_i < 0:
+        logger.warning("Input is missing the mandatory 'device_hostname'/'ip_address' columns.")
         return {'status': False, 'data': None}
 
-    # Convert the address_table to a list of Address_FQDN objects
-    # first, clean up hostname data.  remove fqdn and keep only hostname
-    for address in address_table:
-        address['device_hostname'] = _clean_device_hostname(address['device_hostname'])
+    # Clean up hostname data and build the Address_FQDN constructor arguments in a single
+    # pass over the stream.
+    address_table = []
+    for row in csv_rows:
+        if not row:
+            continue    # blank separator lines are common in exported sheets
+        if len(row) <= host_i or len(row) <= ip_i:
+            logger.warning("Skipping short row:  %s", row)
+            continue
+        # remove fqdn and keep only hostname
+        hostname = _clean_device_hostname(row[host_i])
         # If an interface name was provided, we'll convert it to a hostname
-        if 'interface_name' in address.keys():
-            if len(address['interface_name']) > 0:
-                try:
-                    address['device_hostname'] = _clean_interface_hostname(address['device_hostname'], address['interface_name'])
-                except Exception as error:
-                    logging.warning(f"Object data build failed on:  {address['device_hostname']} - {address['ip_address']}\n{error}")
-
-    for i, address in enumerate(address_table):
-        address_data = {}
-        address_data.update({
-            'ipv4_address': address['ip_address'], 
-            'hostname': address['device_hostname']})
-        if 'domain' in address.keys():
-            address_data.update({'domain': address['domain']})
-        else:
-            address_data.update({'domain': None})
-        address_table[i] = address_data
+        interface = row[iface_i] if 0 <= iface_i < len(row) else ''
+        if len(interface) > 0:
+            try:
+                hostname = _clean_interface_hostname(hostname, interface)
+            except Exception as error:
+                logger.warning("Object data build failed on:  %s - %s\n%s", hostname, row[ip_i], error)
+        domain = row[domain_i] if 0 <= domain_i < len(row) else None
+        address_table.append((row[ip_i], hostname, domain))
+
+    if len(address_table) == 0:
+        logger.warning("No data was provided.")
+        return {'status': False, 'data': None}
+    # Real-world CSVs repeat (ip, hostname, domain) entries (HSRP/VRRP vIPs, management
+    # addresses under multiple device views); build and resolve each unique record once
+    # and fan the shared object back out to every row that referenced it.
+    unique_objects = {}
     address_objects = []
-    if s.MULTITHREAD:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=20) as executor:
-            for address in address_table:
-                try:
-                    executor.submit(_build_address_fqdn_object, address_objects, address)
-                except Exception as error:
-                    logging.warning(f"Object data build failed on:  {address['hostname']} - {address['ipv4_address']}\n{error}")
-    else:
-        for address in address_table:
+    for address in address_table:
+        # each entry is already a hashable (ip, hostname, domain) tuple, so it is its own key
+        address_object = unique_objects.get(address)
+        if address_object is None:
             try:
-                address_objects.append(Address_FQDN(**address))
+                address_object = Address_FQDN(*address)
             except Exception as error:
-                logging.warning(f"Object data build failed on:  {address['hostname']} - {address['ipv4_address']}\n{error}")
+                logger.warning("Object data build failed on:  %s - %s\n%s", address[1], address[0], error)
+                continue
+            unique_objects[address] = address_object
+        address_objects.append(address_object)
+
+    # Resolve all of the forward/reverse lookups in one async batch.  With --no-dns the
+    # lookup fields stay None and the run is bounded only by the normalization step.
+    if not args.no_dns:
+        asyncio.run(_resolve_all(list(unique_objects.values())))
 
 
     # Reformat and save data to a spreadsheet
     if s.SAVE_TO_CSV:
-        output_data = [[
-            "FQDN",
-            "PTR",
-            "IP Address",
-            "FLU Exists",
-            "FLU Existing Value",
-            "FLU Needs Update",
-            "RLU Exists",
-            "RLU Existing Value",
-            "RLU Needs Update"]]
-        for obj in address_objects:
-            output_data.append([
-                obj.full_name,
-                obj.ptr_record,
-                obj.ip_address,
-                obj.forward_lookup_exists,
-                obj.forward_lookup_existing_value,
-                obj.forward_lookup_needs_update,
-                obj.reverse_lookup_exists,
-                obj.reverse_lookup_existing_value,
-                obj.reverse_lookup_needs_update
-            ])
-        tools.SaveFile.gui_ask_save_csv(output_data)
+        fqdn_table = FQDNTable.from_objects(address_objects)
+        output_data = itertools.chain([FQDNTable.HEADER], fqdn_table.rows())
+        if args.output:
+            tools.SaveFile.write_csv(args.output, output_data)
+        else:
+            tools.SaveFile.gui_ask_save_csv(output_data)
 
     return {'status': True, 'data': address_objects}
 
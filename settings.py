@@ -1,3 +1,7 @@
+# Built-in modules
+import sys
+
+
 # Default domain for all entries that don't contain a pre-defined domain.
 # default:  DEFAULT_DOMAIN = 'example.com'
 DEFAULT_DOMAIN = 'gatesint.com'
@@ -26,13 +30,41 @@ INTERFACE_MAP = {
     'vlan': 'vl',
     'bvi': 'bv',
 }
+# Interned once at load so the per-row lookup hits the pointer-equality fast path instead of
+# comparing key strings character by character.
+INTERFACE_MAP = {sys.intern(key): sys.intern(value) for key, value in INTERFACE_MAP.items()}
 
 
-# Enable or disable multithreading.  Useful to disable while troubleshooting class Address_FQDN().
+# Enable or disable concurrent DNS resolution.  Useful to disable while troubleshooting class Address_FQDN(),
+# since lookups then run one at a time.
 # default:  MULTITHREAD = True
 MULTITHREAD = True
 
 
+# Where failed DNS lookups (NXDOMAIN, timeouts) are remembered between runs, so a re-run
+# within DNS_FAILURE_TTL skips the network for known-missing names.  Set to None to keep
+# the cache in memory only.
+# default:  DNS_CACHE_PATH = '~/.cache/fqdn_generator/dns.sqlite'
+DNS_CACHE_PATH = '~/.cache/fqdn_generator/dns.sqlite'
+
+
+# How long (in seconds) failed DNS lookups are remembered, both in memory and on disk.
+# default:  DNS_FAILURE_TTL = 60
+DNS_FAILURE_TTL = 60
+
+
+# Explicit upstream nameservers for the resolver channel; c-ares round-robins across them
+# when more than one is listed.  Leave empty to use the system resolver configuration.
+# default:  NAMESERVERS = []
+NAMESERVERS = []
+
+
+# Maximum number of DNS lookups kept in flight at once.  The effective value is capped at the
+# number of input rows.  Only applies when MULTITHREAD is True.
+# default:  MAX_CONCURRENT_LOOKUPS = 256
+MAX_CONCURRENT_LOOKUPS = 256
+
+
 # If a PTR record already exists for an interface on the device, it will not replace the interface PTR
 # with a node PTR, if this setting is set to True.
 # default:  PREFER_INTERFACE_FQDN_PTR = True
@@ -1,10 +1,23 @@
 # Built-in modules
+import atexit
 import csv
 import os
 import logging
 import argparse
-import tkinter as tk
-from tkinter import filedialog
+import socket
+import sqlite3
+import threading
+import time
+# NOTE:  tkinter is intentionally imported inside the gui_* functions.  Batch runs driven by
+# --input/--output never touch Tk, so headless servers skip the import and display handshake.
+
+# Third-party modules
+try:
+    import pyarrow
+    import pyarrow.compute
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
 
 
 class OpenFile():
@@ -20,10 +33,53 @@ class OpenFile():
 
     @staticmethod
     def process_csv(csv_file_path):
-        csv_file = open(csv_file_path, 'r')
-        csv_contents = csv.reader(csv_file, delimiter=',')
-        mycsv = list(csv_contents)
-        return mycsv
+        """Returns a (columns, rows) pair:  the header as a list of column names, and an
+        iterator of raw value sequences in the same order.
+
+        Positional rows skip the per-row dict allocation and per-field hashing that
+        DictReader pays; callers resolve the column indices they need once up front.
+
+        When pyarrow is installed, its SIMD-accelerated C++ tokenizer does the parsing
+        (an order of magnitude faster than the pure-Python csv module); every column is
+        parsed as string with nulls filled as "", so the values are identical to the
+        stdlib branch's.  Otherwise rows are streamed off a csv.reader, so parsing
+        overlaps with the downstream work and memory stays bounded."""
+        if pyarrow is not None:
+            # Declare every column as string up front:  casting after read_csv would run
+            # type inference first and reshape numeric-looking values ("0123" -> "123",
+            # bool-looking cells -> "true"/"false").
+            with open(csv_file_path, 'r', newline='') as csv_file:
+                header = next(csv.reader(csv_file, delimiter=','), [])
+            convert_options = pyarrow.csv.ConvertOptions(
+                column_types={name: pyarrow.string() for name in header})
+
+            # The stdlib branch tolerates ragged rows (the caller skips them with a
+            # warning), so skip-and-warn here too instead of letting ArrowInvalid kill
+            # the whole run.
+            def _skip_invalid_row(row):
+                logging.warning("Skipping short row:  %s", row.text)
+                return 'skip'
+
+            parse_options = pyarrow.csv.ParseOptions(invalid_row_handler=_skip_invalid_row)
+            try:
+                table = pyarrow.csv.read_csv(csv_file_path,
+                                             parse_options=parse_options,
+                                             convert_options=convert_options)
+            except pyarrow.ArrowInvalid:
+                # an empty file has no rows to stream; header is [] in that case too
+                return header, iter(())
+            columns = [pyarrow.compute.fill_null(column, "") for column in table.columns]
+            return table.column_names, zip(*(column.to_pylist() for column in columns))
+        csv_file = open(csv_file_path, 'r', newline='')
+        reader = csv.reader(csv_file, delimiter=',')
+        header = next(reader, [])
+
+        def _rows():
+            with csv_file:
+                for row in reader:
+                    yield row
+
+        return header, _rows()
 
 
     @staticmethod
@@ -43,16 +99,116 @@ class OpenFile():
         
         Builds a dialogue box and make sure the window comes to the front of the desktop
         """
+        import tkinter as tk
+        from tkinter import filedialog
         root = tk.Tk()
         root.withdraw()
         root.attributes('-topmost',True)
         # Ask the user for the file location
-        file_path = tk.filedialog.askopenfilename(defaultextension=defaultextension, filetypes=filetypes )
+        file_path = filedialog.askopenfilename(defaultextension=defaultextension, filetypes=filetypes )
         # Kill the tk window
         root.destroy()
         return file_path
 
 
+class DNSCache():
+    """A process-wide TTL cache for forward/reverse DNS lookups.
+
+    Many CSV rows share subnets and domain suffixes, so duplicate lookups are common.
+    Successful answers are kept for success_ttl seconds; failed lookups (NXDOMAIN, timeouts)
+    are negatively cached for failure_ttl seconds so retries within a run don't re-query.
+    Safe to share across threads; writes are serialized with an RLock.
+
+    When persist_path is set, failures are additionally recorded in a small sqlite
+    database, so a re-run within failure_ttl skips the network for known-missing names
+    entirely (NXDOMAIN answers often cost full multi-resolver timeouts).  Successful
+    answers stay in memory only.
+    """
+
+    # Sentinel returned by get() for absent/expired entries, since None is a storable value.
+    MISS = object()
+
+    def __init__(self, success_ttl: float = 3600, failure_ttl: float = 60, persist_path: str = None):
+        self.success_ttl = success_ttl
+        self.failure_ttl = failure_ttl
+        self._forward = {}
+        self._reverse = {}
+        self._lock = threading.RLock()
+        self._db = None
+        self._dirty = 0
+        if persist_path is not None:
+            persist_path = os.path.expanduser(persist_path)
+            try:
+                os.makedirs(os.path.dirname(persist_path), exist_ok=True)
+                self._db = sqlite3.connect(persist_path, check_same_thread=False)
+                # WAL keeps readers off the writer's back and NORMAL sync avoids an fsync
+                # per transaction; losing the last batch of negative entries on a crash
+                # only costs a re-query.
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS dns_cache "
+                    "(key TEXT, kind TEXT, value TEXT, expires REAL, PRIMARY KEY (key, kind))")
+                self._db.execute("DELETE FROM dns_cache WHERE expires <= ?", (time.time(),))
+                self._db.commit()
+                atexit.register(self.flush)
+            except (OSError, sqlite3.Error) as error:
+                logging.warning("Could not open the persistent DNS cache at %s, continuing in-memory only:\n%s",
+                                persist_path, error)
+                self._db = None
+
+    def _table(self, kind: str):
+        return self._forward if kind == 'forward' else self._reverse
+
+    def get(self, kind: str, key: str):
+        """Returns the cached value for key, or DNSCache.MISS if absent/expired.
+
+        A cached failure is re-raised, so callers handle it exactly like a fresh lookup failure.
+        """
+        with self._lock:
+            entry = self._table(kind).get(key)
+        if entry is not None:
+            value, expires_at = entry
+            if time.monotonic() < expires_at:
+                if isinstance(value, Exception):
+                    raise value
+                return value
+        # Only failures are persisted; a hit here re-raises like a fresh lookup failure.
+        if self._db is not None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT value, expires FROM dns_cache WHERE key = ? AND kind = ?",
+                    (key, kind)).fetchone()
+            if row is not None and time.time() < row[1]:
+                raise socket.gaierror(row[0])
+        return self.MISS
+
+    def store(self, kind: str, key: str, value):
+        with self._lock:
+            self._table(kind)[key] = (value, time.monotonic() + self.success_ttl)
+
+    def store_failure(self, kind: str, key: str, error: Exception):
+        with self._lock:
+            self._table(kind)[key] = (error, time.monotonic() + self.failure_ttl)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO dns_cache (key, kind, value, expires) VALUES (?, ?, ?, ?)",
+                    (key, kind, str(error), time.time() + self.failure_ttl))
+                # Commit in batches:  one commit per failed lookup would put a journal write
+                # in the hot path of exactly the bulk-miss runs this cache exists to speed up.
+                self._dirty += 1
+                if self._dirty >= 128:
+                    self._db.commit()
+                    self._dirty = 0
+
+    def flush(self):
+        """Commits any buffered failure rows; runs between batches and at interpreter exit."""
+        with self._lock:
+            if self._db is not None and self._dirty:
+                self._db.commit()
+                self._dirty = 0
+
+
 class NewLineFormatter(logging.Formatter):
 
     def __init__(self, fmt, datefmt=None):
@@ -87,40 +243,51 @@ def setup_logger(log_level='WARNING', log_type='console'):
         dir_path = os.path.dirname(os.path.realpath(__file__))
         # NOTE TO SELF:
         # os.path.realpath(path) (returns "the canonical path of the specified filename, eliminating any symbolic links encountered in the path")
-        log_file = f'{dir_path}\\logs\\automation.log'
+        log_file = os.path.join(dir_path, 'logs', 'automation.log')
         os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        logging.basicConfig(filename=log_file, format=formatter, level=log_level)
+        handler = logging.FileHandler(log_file)
         print(f"Log file located here:\n\
         {log_file}\n")
     else:
-        logging.basicConfig(format=formatter, level=log_level)
+        handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
 
+    # Manage the root handler list directly:  basicConfig is a no-op once the root logger
+    # already has handlers (so re-invocation would silently keep the old level), and its
+    # format= kwarg expects a string rather than a Formatter object anyway.
     logger = logging.getLogger()
-    logger.handlers[0].setFormatter(formatter)
+    logger.handlers.clear()
+    logger.addHandler(handler)
+    logger.setLevel(log_level)
 
     return logger
 
 
-def table_to_dictionary(table):
-    """Takes a table with a top row for column names, and converts table entries to dictionaries."""
-    columns = table[0]
-    del table[0]
-    results = []
-    for row in table:
-        results.append(dict(zip(columns,row)))
-    return results
-
-
 class SaveFile():
     """A collection of use used for asking users where to save files"""
+
+    @staticmethod
+    def write_csv(output_file, output_data):
+        """Writes an iterable of rows to output_file as CSV, with no user interaction."""
+        #  newline="" is required with python3 to avoid a "double newline"; the large
+        #  buffer amortizes disk flushes, and writerows() dispatches all rows in one call
+        with open(output_file, "w", newline="", buffering=1<<20) as out_file:
+            writer = csv.writer(out_file, delimiter=",")
+            writer.writerows(output_data)
+
     @staticmethod
-    def gui_ask_save_csv(output_data: list):
+    def gui_ask_save_csv(output_data):
         """Pops up a TK interface window that ask where to save a csv-formatted file.
 
-        Input data must be comma-deliminated.  Each row should be a string.
+        output_data can be any iterable of rows (a header row first, then data rows).
 
-        This fuction assumes you have a header row and at least one row of data.  
+        This fuction assumes you have a header row and at least one row of data.
         """
+        import tkinter as tk
+        from tkinter import filedialog
+        # Materialised once up front, so a failed save attempt can be retried with the same rows
+        if not isinstance(output_data, list):
+            output_data = list(output_data)
         while True:
             try:
                 #  Build a dialogue box and make sure the window comes to the front of the desktop
@@ -128,15 +295,11 @@ class SaveFile():
                 root.withdraw()
                 root.attributes("-topmost",True)
                 #  Ask the user for the file name using a dialogue box
-                output_file = tk.filedialog.asksaveasfilename(defaultextension=".csv", filetypes=( ("Comma Separated", "*.csv"),("All Files", "*.*") ))
+                output_file = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=( ("Comma Separated", "*.csv"),("All Files", "*.*") ))
                 #  Kill the tk window
                 root.destroy()
 
-                #  Open the file and dump the contents of result_table into it
-                with open(output_file, "w", newline="") as out_file:    # newline="" is required with python3 to avoid a "double newline"
-                    writer = csv.writer(out_file, delimiter=",") 
-                    for row in output_data:
-                        writer.writerow(row)
+                SaveFile.write_csv(output_file, output_data)
             except Exception as error:
                 print(error)
                 print("\n :: Choose a new location :: ")
@@ -162,11 +325,28 @@ def argument_parser():
         choices=['critical', 'error', 'warning', 'info', 'debug'],
         help="Sets the logging level for the application.",
     )
-    parser.add_argument('--log_type', 
-        dest="log_type", 
+    parser.add_argument('--log_type',
+        dest="log_type",
         type=str.lower,
         default="file",
         choices=['console', 'file', 'disabled'],
         help="Sets the logging type for the application",
     )
+    parser.add_argument('--no-dns',
+        dest="no_dns",
+        action="store_true",
+        help="Skips all DNS lookups and only writes the normalized FQDNs.  The lookup columns are left empty.",
+    )
+    parser.add_argument('--input',
+        dest="input",
+        type=str,
+        default=None,
+        help="Path to the input CSV file.  Skips the file-open dialog, for batch/headless runs.",
+    )
+    parser.add_argument('--output',
+        dest="output",
+        type=str,
+        default=None,
+        help="Path for the output CSV file.  Skips the file-save dialog, for batch/headless runs.",
+    )
     return parser
\ No newline at end of file